@@ -6,8 +6,21 @@ Creation Date: September 14, 2025
 External Sources: N/A - Original Code
 """
 import random
+from collections import deque
+
 from core.cell import Cell
 
+# Board dimensions are fixed by the project spec; module-level constants let
+# the hot loops read them as globals instead of chasing attribute lookups.
+ROWS = 10
+COLS = 10
+
+# Result codes returned by Board.reveal_cell so callers get the click
+# outcome (including a win) in one call instead of polling separately.
+REVEAL_SAFE = 0
+REVEAL_MINE = 1
+REVEAL_WIN = 2
+
 class Board:
     """
     Description: Manages the Minesweeper game board including mine placement, cell management, and win/loss logic.
@@ -27,18 +40,55 @@ class Board:
         External Sources: N/A - Original Code
         """
         # Original implementation - board configuration
-        self.ROWS = 10
-        self.COLS = 10
+        self.ROWS = ROWS
+        self.COLS = COLS
         self.mine_count = max(10, min(20, mine_count))  # Ensure mine count is between 10-20
         self.first_click = True  # Track if this is the first click
         
         # Initialize 2D grid of Cell objects
-        self.grid = [[Cell() for _ in range(self.COLS)] for _ in range(self.ROWS)]
-        
+        self.grid = [[Cell() for _ in range(COLS)] for _ in range(ROWS)]
+        # Flat view of the same Cell objects for whole-board traversals
+        # (avoids nested index chains when every cell is visited).
+        self.cells = tuple(cell for grid_row in self.grid for cell in grid_row)
+        # Precompute each cell's in-bounds neighbor coordinates once so the
+        # hot paths never redo the 3x3 offset-and-bounds-check dance.
+        self.neighbors = [[tuple((row + dr, col + dc)
+                                 for dr in (-1, 0, 1)
+                                 for dc in (-1, 0, 1)
+                                 if (dr or dc)
+                                 and 0 <= row + dr < ROWS
+                                 and 0 <= col + dc < COLS)
+                           for col in range(COLS)]
+                          for row in range(ROWS)]
+
         # Track game statistics
         self.revealed_cells = 0
-        self.total_safe_cells = self.ROWS * self.COLS - self.mine_count
+        self.flag_count = 0
+        self.total_safe_cells = ROWS * COLS - self.mine_count
     
+    def reset(self, mine_count=None):
+        """
+        Description: Reset the board in place for a new game, reusing the existing cell grid and neighbor table.
+        Args:
+            mine_count (int, optional): New mine count, uses current if None
+        Returns: None
+        Author: Tuan Vu
+        Creation Date: September 14, 2025
+        External Sources: N/A - Original Code
+        """
+        # Clear every cell in place instead of reallocating 100 Cell objects
+        # (and the grid/neighbor structures) on each new game.
+        if mine_count is not None:
+            self.mine_count = max(10, min(20, mine_count))
+
+        for cell in self.cells:
+            cell.reset()
+
+        self.first_click = True
+        self.revealed_cells = 0
+        self.flag_count = 0
+        self.total_safe_cells = ROWS * COLS - self.mine_count
+
     def place_mines(self, safe_row, safe_col):
         """
         Description: Randomly place mines on the board, avoiding the first clicked cell and its neighbors.
@@ -52,23 +102,18 @@ class Board:
         """
         # Original implementation - random mine placement with safe zone
         # Create list of safe cells (first clicked cell and all adjacent cells)
-        safe_cells = set()
         # Mark the first clicked cell and its neighbors as safe.
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                new_row, new_col = safe_row + dr, safe_col + dc
-                if 0 <= new_row < self.ROWS and 0 <= new_col < self.COLS:
-                    safe_cells.add((new_row, new_col))
+        safe_cells = {(safe_row, safe_col)}
+        safe_cells.update(self.neighbors[safe_row][safe_col])
         
-        mines_placed = 0
-        # Place mines randomly, avoiding safe cells and already mined cells.
-        while mines_placed < self.mine_count:
-            row = random.randint(0, self.ROWS - 1)
-            col = random.randint(0, self.COLS - 1)
-            if (row, col) in safe_cells or self.grid[row][col].is_mine:
-                continue
+        # Sample the mine positions without replacement from the eligible
+        # cells - one pass, no rejection loop, no duplicate re-rolls.
+        eligible = [(row, col)
+                    for row in range(ROWS)
+                    for col in range(COLS)
+                    if (row, col) not in safe_cells]
+        for row, col in random.sample(eligible, self.mine_count):
             self.grid[row][col].set_mine()
-            mines_placed += 1
         
         # Calculate adjacent mine counts for all cells
         # After placing mines, calculate adjacent mine counts for all cells.
@@ -76,45 +121,29 @@ class Board:
     
     def _calculate_adjacent_mines(self):
         """
-        Description: Calculate the number of adjacent mines for each cell.
+        Description: Calculate the number of adjacent mines for each cell by scattering each mine into its neighbors' counts.
         Args: None
         Returns: None
         Author: Tuan Vu
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
-        # Original implementation - adjacent mine calculation
-        for row in range(self.ROWS):
-            for col in range(self.COLS):
-                if not self.grid[row][col].is_mine:
-                    count = self._count_adjacent_mines(row, col)
-                    self.grid[row][col].set_adjacent_mines(count)
-    
-    def _count_adjacent_mines(self, row, col):
-        """
-        Description: Count mines in the 8 cells adjacent to the given position.
-        Args:
-            row (int): Row position (0-9)
-            col (int): Column position (0-9)
-        Returns: int - Number of adjacent mines (0-8)
-        Author: Tuan Vu
-        Creation Date: September 14, 2025
-        External Sources: N/A - Original Code
-        """
-        # Original implementation - count mines in 3x3 grid around cell
-        count = 0
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:  # Skip the cell itself
-                    continue
-                
-                new_row, new_col = row + dr, col + dc
-                if (0 <= new_row < self.ROWS and 
-                    0 <= new_col < self.COLS and 
-                    self.grid[new_row][new_col].is_mine):
-                    count += 1
-        
-        return count
+        # Single pass over the mines: each mine increments the count of its
+        # neighbors, so work scales with mine count instead of re-counting
+        # the full 3x3 window around every cell on the board.
+        grid = self.grid
+        neighbors = self.neighbors
+        counts = [[0] * COLS for _ in range(ROWS)]
+        for row in range(ROWS):
+            for col in range(COLS):
+                if grid[row][col].is_mine:
+                    for new_row, new_col in neighbors[row][col]:
+                        counts[new_row][new_col] += 1
+
+        for row in range(ROWS):
+            for col in range(COLS):
+                if not grid[row][col].is_mine:
+                    grid[row][col].set_adjacent_mines(counts[row][col])
     
     def reveal_cell(self, row, col):
         """
@@ -122,43 +151,47 @@ class Board:
         Args:
             row (int): Row position (0-9)
             col (int): Column position (0-9)
-        Returns: bool - True if mine was hit (game over), False otherwise
+        Returns: int - REVEAL_MINE if a mine was hit, REVEAL_WIN if this reveal won the game, REVEAL_SAFE otherwise
         Author: Tuan Vu
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
         # Original implementation - cell revealing logic
-        if not (0 <= row < self.ROWS and 0 <= col < self.COLS):
-            return False
-        
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            return REVEAL_SAFE
+
         cell = self.grid[row][col]
-        
+
         # Handle first click - place mines after first click to ensure safety
         if self.first_click:
             self.place_mines(row, col)
             self.first_click = False
-        
+
         # Cannot reveal flagged or already revealed cells
         if cell.is_flagged or cell.is_revealed:
-            return False
-        
-        # Reveal the cell
-        cell.reveal()
-        self.revealed_cells += 1
-        
+            return REVEAL_SAFE
+
+        # Reveal the cell; only count the reveal if the state actually changed
+        # so the win-check counter can never drift from the grid.
+        if cell.reveal():
+            self.revealed_cells += 1
+
         # Check if mine was hit
         if cell.is_mine:
-            return True  # Game over
-        
+            return REVEAL_MINE  # Game over
+
         # If cell has no adjacent mines, recursively reveal adjacent cells
         if cell.adjacent_mines == 0:
             self._reveal_adjacent_cells(row, col)
-        
-        return False  # Safe cell revealed
+
+        # Report the win transition directly so callers need not poll
+        if self.revealed_cells == self.total_safe_cells:
+            return REVEAL_WIN
+        return REVEAL_SAFE  # Safe cell revealed, game continues
     
     def _reveal_adjacent_cells(self, row, col):
         """
-        Description: Recursively reveal adjacent cells when a cell with 0 adjacent mines is revealed.
+        Description: Iteratively reveal adjacent cells when a cell with 0 adjacent mines is revealed, using a breadth-first search.
         Args:
             row (int): Row position of cell with 0 adjacent mines
             col (int): Column position of cell with 0 adjacent mines
@@ -167,47 +200,51 @@ class Board:
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
-        # Original implementation - recursive revealing
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:  # Skip the cell itself
-                    continue
-                
-                new_row, new_col = row + dr, col + dc
-                if (0 <= new_row < self.ROWS and 
-                    0 <= new_col < self.COLS):
-                    
-                    adjacent_cell = self.grid[new_row][new_col]
-                    if (not adjacent_cell.is_revealed and 
-                        not adjacent_cell.is_flagged and 
-                        not adjacent_cell.is_mine):
-                        
-                        adjacent_cell.reveal()
-                        self.revealed_cells += 1
-                        
-                        # Continue recursion if this cell also has 0 adjacent mines
-                        if adjacent_cell.adjacent_mines == 0:
-                            self._reveal_adjacent_cells(new_row, new_col)
+        # Iterative BFS over zero-count cells; is_revealed doubles as the
+        # visited marker, so no cell is expanded twice and large empty
+        # regions cannot overflow the Python call stack.
+        grid = self.grid
+        neighbors = self.neighbors
+        queue = deque([(row, col)])
+        while queue:
+            cur_row, cur_col = queue.popleft()
+            for new_row, new_col in neighbors[cur_row][cur_col]:
+                adjacent_cell = grid[new_row][new_col]
+                if (not adjacent_cell.is_revealed and
+                    not adjacent_cell.is_flagged and
+                    not adjacent_cell.is_mine and
+                    adjacent_cell.reveal()):
+
+                    self.revealed_cells += 1
+
+                    # Expand this cell too if it also has 0 adjacent mines
+                    if adjacent_cell.adjacent_mines == 0:
+                        queue.append((new_row, new_col))
     
     def toggle_flag(self, row, col):
         """
-        Description: Toggle the flag state of a cell. Only allow flagging if not revealed. Unflagging always allowed.
+        Description: Toggle the flag state of a cell. Only allow flagging if not revealed and flags remain. Unflagging always allowed.
         Args:
             row (int): Row position (0-9)
             col (int): Column position (0-9)
-        Returns: bool - True if flag was toggled, False otherwise
+        Returns: bool or None - True if the cell is now flagged, False if now unflagged, None if nothing changed
         Author: Tuan Vu
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
-        if not (0 <= row < self.ROWS and 0 <= col < self.COLS):
-            return False
+        if not (0 <= row < ROWS and 0 <= col < COLS):
+            return None
         cell = self.grid[row][col]
         if cell.is_revealed:
-            return False
-        # Toggle flag
+            return None
+        # Placing a new flag is capped at the mine count; unflagging is
+        # always allowed
+        if not cell.is_flagged and self.flag_count >= self.mine_count:
+            return None
+        # Toggle flag and keep the running count in sync
         cell.is_flagged = not cell.is_flagged
-        return True
+        self.flag_count += 1 if cell.is_flagged else -1
+        return cell.is_flagged
     
     def get_flag_count(self):
         """
@@ -218,13 +255,8 @@ class Board:
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
-        # Original implementation - count flags
-        count = 0
-        for row in range(self.ROWS):
-            for col in range(self.COLS):
-                if self.grid[row][col].is_flagged:
-                    count += 1
-        return count
+        # The count is maintained incrementally by toggle_flag, so this is O(1).
+        return self.flag_count
     
     def get_remaining_mines(self):
         """
@@ -259,11 +291,10 @@ class Board:
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
-        # Original implementation - reveal mines on game over
-        for row in range(self.ROWS):
-            for col in range(self.COLS):
-                if self.grid[row][col].is_mine:
-                    self.grid[row][col].is_revealed = True
+        # Reveal mines over the flat cell view - one pass, no index math.
+        for cell in self.cells:
+            if cell.is_mine:
+                cell.is_revealed = True
     
     def get_cell(self, row, col):
         """
@@ -277,7 +308,7 @@ class Board:
         External Sources: N/A - Original Code
         """
         # Return cell if within bounds, else None.
-        if 0 <= row < self.ROWS and 0 <= col < self.COLS:
+        if 0 <= row < ROWS and 0 <= col < COLS:
             return self.grid[row][col]
         return None
     
@@ -290,11 +321,12 @@ class Board:
         Creation Date: September 14, 2025
         External Sources: N/A - Original Code
         """
-        # Build a string representation of the board for debugging.
-        result = "  A B C D E F G H I J\n"
-        for row in range(self.ROWS):
-            result += f"{row + 1:2} "
-            for col in range(self.COLS):
-                result += self.grid[row][col].get_display_value() + " "
-            result += "\n"
-        return result
\ No newline at end of file
+        # Build the rows as a list and join once - avoids the repeated
+        # string concatenation of the += version.
+        grid = self.grid
+        rows = ["  A B C D E F G H I J"]
+        for row in range(ROWS):
+            cells = " ".join(grid[row][col].get_display_value()
+                             for col in range(COLS))
+            rows.append(f"{row + 1:2} {cells} ")
+        return "\n".join(rows) + "\n"
\ No newline at end of file
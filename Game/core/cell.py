@@ -12,7 +12,11 @@ class Cell:
     Creation Date: September 14, 2025
     External Sources: N/A - Original Code
     """
-    
+
+    # Fixed attribute set: dropping the per-instance __dict__ cuts each
+    # cell's footprint several-fold and keeps the 100-cell grid compact.
+    __slots__ = ('is_mine', 'is_revealed', 'is_flagged', 'adjacent_mines')
+
     def __init__(self):
         """
         Description: Initialize a new cell with default values (no mine, not revealed, not flagged, 0 adjacent mines).
@@ -28,6 +32,21 @@ class Cell:
         self.is_flagged = False       # True if this cell has been flagged by player
         self.adjacent_mines = 0       # Count of mines in adjacent cells (0-8)
     
+    def reset(self):
+        """
+        Description: Return this cell to its default state so it can be reused for a new game.
+        Args: None
+        Returns: None
+        Author: Kevinh Nguyen
+        Creation Date: September 14, 2025
+        External Sources: N/A - Original Code
+        """
+        # Clear all state in place - avoids reallocating cells per game
+        self.is_mine = False
+        self.is_revealed = False
+        self.is_flagged = False
+        self.adjacent_mines = 0
+
     def set_mine(self):
         """
         Description: Mark this cell as containing a mine.
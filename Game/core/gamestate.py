@@ -38,12 +38,16 @@ class GameState:
         """
         # Original implementation - game state tracking
         self.status = GameStatus.PLAYING
+        # Cache the display string so per-frame reads skip Enum machinery
+        self.status_text = GameStatus.PLAYING.value
         self.mine_count = mine_count
         # Game statistics
         self.cells_revealed = 0
         self.flags_placed = 0
         self.first_click_made = False
         self.flags_left = mine_count  # Track remaining flags
+        # Cached get_game_info dict; invalidated whenever state changes
+        self._info = None
     
     def start_game(self):
         """
@@ -56,7 +60,9 @@ class GameState:
         """
         # Original implementation
         self.status = GameStatus.PLAYING
+        self.status_text = GameStatus.PLAYING.value
         self.first_click_made = False
+        self._info = None
     
     def end_game(self, won=False):
         """
@@ -70,6 +76,8 @@ class GameState:
         """
         # Original implementation
         self.status = GameStatus.WON if won else GameStatus.LOST
+        self.status_text = self.status.value
+        self._info = None
     
     def is_game_active(self):
         """
@@ -92,8 +100,8 @@ class GameState:
         Creation Date: September 19, 2025
         External Sources: N/A - Original Code
         """
-        # Original implementation
-        return self.status.value
+        # Return the string cached when the status last changed
+        return self.status_text
     
     def update_statistics(self, cells_revealed, flags_placed):
         """
@@ -109,6 +117,7 @@ class GameState:
         # Original implementation
         self.cells_revealed = cells_revealed
         self.flags_placed = flags_placed
+        self._info = None
     
     def get_remaining_mines(self):
         """
@@ -133,6 +142,7 @@ class GameState:
         """
         # Original implementation
         self.first_click_made = True
+        self._info = None
     
     def reset(self, mine_count=None):
         """
@@ -149,10 +159,13 @@ class GameState:
             self.mine_count = mine_count
         
         self.status = GameStatus.PLAYING
+        self.status_text = GameStatus.PLAYING.value
         self.cells_revealed = 0
         self.flags_placed = 0
         self.first_click_made = False
-    
+        self.flags_left = self.mine_count
+        self._info = None
+
     def get_game_info(self):
         """
         Description: Get comprehensive game information as a dictionary.
@@ -162,16 +175,19 @@ class GameState:
         Creation Date: September 19, 2025
         External Sources: N/A - Original Code
         """
-        # Original implementation
-        return {
-            'status': self.get_status_text(),
-            'mine_count': self.mine_count,
-            'remaining_mines': self.get_remaining_mines(),
-            'cells_revealed': self.cells_revealed,
-            'flags_placed': self.flags_placed,
-            'first_click_made': self.first_click_made,
-            'is_active': self.is_game_active()
-        }
+        # Rebuild only after a state change; repeat calls between
+        # changes return the cached dict.
+        if self._info is None:
+            self._info = {
+                'status': self.get_status_text(),
+                'mine_count': self.mine_count,
+                'remaining_mines': self.get_remaining_mines(),
+                'cells_revealed': self.cells_revealed,
+                'flags_placed': self.flags_placed,
+                'first_click_made': self.first_click_made,
+                'is_active': self.is_game_active()
+            }
+        return self._info
     
     def __str__(self):
         """
@@ -8,6 +8,29 @@ External Sources: N/A - Original Code
 
 import pygame
 
+# Column header characters, indexed by column number.
+_COL_LABELS = tuple(chr(ord('A') + i) for i in range(26))
+
+# Shared Font objects keyed by point size; constructing a Font parses the
+# default font file, so each size is loaded once per process even if the
+# game object is built again.
+_FONT_CACHE = {}
+
+def get_font(size):
+    """
+    Description: Return the shared default-font Font object for a size, creating it on first request.
+    Args:
+        size (int): Point size of the font
+    Returns: pygame.font.Font - Shared font instance for that size
+    Author: John Tran
+    Creation Date: September 16, 2025
+    External Sources: N/A - Original Code
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
 class Renderer:
     """
     Description: Handles all rendering and drawing operations for the Minesweeper game. Manages the visual representation of the game board, UI elements, and screen states (start screen, game screen, end screen).
@@ -27,7 +50,256 @@ class Renderer:
         External Sources: N/A - Original Code
         """
         self.game = game
-    
+        # Large fonts for the start/end screens, created once; constructing
+        # a Font reopens the default font file, so doing it per frame in
+        # the draw methods was pure waste.
+        self._title_font = get_font(64)
+        self._status_font = get_font(48)
+        self._mine_font = get_font(36)
+        # Cache of rendered text surfaces keyed by (font, text, color).
+        # Font rasterization is the most expensive part of drawing text, and
+        # almost everything the renderer writes is the same strings every
+        # frame, so each distinct string is rendered exactly once.
+        self._text_cache = {}
+        # Pre-rendered cell background tiles with the 1px border baked in;
+        # cell draws become plain blits with no per-cell rect drawing.
+        cell_size = game.CELL_SIZE
+        self._cell_backgrounds = {
+            'covered': self._make_cell_background(game.COLORS['cell_covered']),
+            'revealed': self._make_cell_background(game.COLORS['cell_revealed']),
+            'mine': self._make_cell_background(game.COLORS['cell_mine']),
+        }
+        # Atlas of the twelve complete cell appearances (background,
+        # border, and glyph composited); drawing any cell is one blit.
+        self._cell_tiles = self._make_cell_atlas()
+        # Per-cell state bytes from the last drawn frame, for dirty-cell
+        # detection; _board_stale forces a full repaint (first frame, new
+        # game, screen transitions).
+        self._prev_cell_state = bytearray(game.GRID_WIDTH * game.GRID_HEIGHT)
+        self._board_stale = True
+        # Screen-space cell geometry is invariant for the fixed grid;
+        # compute positions and rects once instead of per frame.
+        self._cell_xy = [(col * cell_size, row * cell_size + game.INFO_HEIGHT)
+                         for row in range(game.GRID_HEIGHT)
+                         for col in range(game.GRID_WIDTH)]
+        self._cell_rects = [pygame.Rect(x, y, cell_size, cell_size)
+                            for x, y in self._cell_xy]
+        # Pre-composed static portion of the info panel (background fill and
+        # column labels); per-frame panel drawing blits this and overlays
+        # only the text that can actually change.
+        self._info_bg = self._make_info_background()
+        self._info_rect = pygame.Rect(0, 0, game.WINDOW_WIDTH,
+                                      game.INFO_HEIGHT)
+        # Pre-rendered start screen; only the mine count on it ever
+        # changes, so the rest is composed once.
+        self._start_bg = self._make_start_background()
+        # Semi-transparent end-screen overlay, built lazily on first use
+        # (convert_alpha needs the display surface to exist).
+        self._end_overlay = None
+        # Snapshot of the finished board + panel taken on the first
+        # end-screen frame; the board cannot change while the end screen
+        # is up, so later end-screen draws restore it with one blit.
+        self._end_base = None
+        # Signature of the last presented frame; when the next frame would
+        # be pixel-identical, draw_game skips drawing and the flip entirely.
+        self._frame_sig = None
+        # End-screen instruction lines pre-rendered and pre-positioned for
+        # both outcomes; drawing either set is one batched blits call.
+        self._end_instructions = {
+            True: self._make_end_instructions([
+                "Press SPACE to play again",
+                "Press UP/DOWN arrows to adjust mines (10-20)",
+                "Press ESC to quit",
+            ]),
+            False: self._make_end_instructions([
+                "Press SPACE to continue to setup",
+                "Press R to retry with same settings",
+                "Press ESC to quit",
+            ]),
+        }
+
+    def _make_end_instructions(self, lines):
+        """
+        Description: Pre-render a list of end-screen instruction lines with their centered positions.
+        Args:
+            lines (list): Instruction strings, top to bottom
+        Returns: list - (Surface, (x, y)) pairs ready for a batched blits call
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        game = self.game
+        blit_seq = []
+        for i, line in enumerate(lines):
+            surface = self._text(game.small_font, line, (255, 255, 255))
+            rect = surface.get_rect(center=(game.WINDOW_WIDTH // 2,
+                                            250 + i * 25))
+            blit_seq.append((surface, rect.topleft))
+        return blit_seq
+
+    def _make_info_background(self):
+        """
+        Description: Build the static info-panel background (fill plus column labels A-J) as one reusable surface.
+        Args: None
+        Returns: pygame.Surface - Pre-composed info panel background
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        game = self.game
+        panel = pygame.Surface((game.WINDOW_WIDTH, game.INFO_HEIGHT)).convert()
+        panel.fill(game.COLORS['background'])
+        for col in range(game.GRID_WIDTH):
+            label_text = self._text(game.small_font, _COL_LABELS[col],
+                                    game.COLORS['text'])
+            x = (col * game.CELL_SIZE + game.CELL_SIZE // 2 -
+                 label_text.get_width() // 2)
+            panel.blit(label_text, (x, game.INFO_HEIGHT - 20))
+        return panel
+
+    def _make_start_background(self):
+        """
+        Description: Build the static portion of the start screen (background, title, subtitle, and instructions) as one reusable surface.
+        Args: None
+        Returns: pygame.Surface - Pre-composed start screen background
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        game = self.game
+        screen = pygame.Surface((game.WINDOW_WIDTH, game.WINDOW_HEIGHT)).convert()
+        screen.fill((64, 64, 64))  # Dark gray background
+
+        # Title
+        title_text = self._text(self._title_font, "MINESWEEPER", (255, 255, 255))
+        screen.blit(title_text,
+                    title_text.get_rect(center=(game.WINDOW_WIDTH // 2, 80)))
+
+        # Subtitle
+        subtitle_text = self._text(game.font, "EECS 581 Project 1", (200, 200, 200))
+        screen.blit(subtitle_text,
+                    subtitle_text.get_rect(center=(game.WINDOW_WIDTH // 2, 120)))
+
+        # Instructions
+        instructions = [
+            "HOW TO PLAY:",
+            "• Left click to reveal cells",
+            "• Right click to flag suspected mines",
+            "• Avoid clicking on mines!",
+            "• Flag all mines to win",
+            "",
+            "CONTROLS:",
+            "• UP/DOWN arrows: Adjust mine count",
+            "• SPACE: Start game",
+            "• ESC: Quit"
+        ]
+
+        for i, instruction in enumerate(instructions):
+            if instruction == "HOW TO PLAY:" or instruction == "CONTROLS:":
+                color = (255, 255, 0)  # Yellow for headers
+                font = game.font
+            elif instruction == "":
+                continue  # Skip empty lines
+            else:
+                color = (255, 255, 255)  # White for regular text
+                font = game.small_font
+
+            inst_text = self._text(font, instruction, color)
+            screen.blit(inst_text,
+                        inst_text.get_rect(center=(game.WINDOW_WIDTH // 2,
+                                                   220 + i * 20)))
+        return screen
+
+    def _make_cell_background(self, color):
+        """
+        Description: Build a reusable cell background tile with the border pre-drawn.
+        Args:
+            color (tuple): RGB fill color for the cell interior
+        Returns: pygame.Surface - Cell-sized background tile
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        cell_size = self.game.CELL_SIZE
+        tile = pygame.Surface((cell_size, cell_size)).convert()
+        tile.fill(color)
+        pygame.draw.rect(tile, self.game.COLORS['border'],
+                         pygame.Rect(0, 0, cell_size, cell_size), 1)
+        return tile
+
+    def _make_cell_atlas(self):
+        """
+        Description: Composite every possible cell appearance (covered, flagged, revealed mine, revealed 0-8) into its own ready-to-blit tile.
+        Args: None
+        Returns: dict - Tiles keyed 'covered'/'flagged'/'mine' plus a 'numbers' list indexed by adjacent mine count
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        game = self.game
+        cell_size = game.CELL_SIZE
+        colors = game.COLORS
+
+        def compose(background, glyph):
+            tile = background.copy()
+            tile.blit(glyph, ((cell_size - glyph.get_width()) // 2,
+                              (cell_size - glyph.get_height()) // 2))
+            return tile
+
+        backgrounds = self._cell_backgrounds
+        numbers = [backgrounds['revealed']]
+        for count in range(1, 9):
+            numbers.append(compose(backgrounds['revealed'],
+                                   self._text(game.font, str(count),
+                                              game.NUMBER_COLORS[count - 1])))
+        return {
+            'covered': backgrounds['covered'],
+            'flagged': compose(backgrounds['covered'],
+                               self._text(game.font, 'F', colors['text'])),
+            'mine': compose(backgrounds['mine'],
+                            self._text(game.font, '*', colors['text'])),
+            'numbers': numbers,
+        }
+
+    def _cell_tile(self, cell):
+        """
+        Description: Select the pre-composited atlas tile matching a cell's state.
+        Args:
+            cell (Cell): Cell to pick the tile for
+        Returns: pygame.Surface - Complete ready-to-blit cell tile
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        if cell.is_revealed:
+            if cell.is_mine:
+                return self._cell_tiles['mine']
+            return self._cell_tiles['numbers'][cell.adjacent_mines]
+        if cell.is_flagged:
+            return self._cell_tiles['flagged']
+        return self._cell_tiles['covered']
+
+    def _text(self, font, text, color):
+        """
+        Description: Return a rendered text Surface, rasterizing on first use and serving repeats from the cache.
+        Args:
+            font (pygame.font.Font): Font to render with
+            text (str): Text to render
+            color (tuple): RGB text color
+        Returns: pygame.Surface - Rendered text surface
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # convert_alpha() stores the glyph surface in the display's
+            # pixel format so repeat blits skip SDL's conversion path.
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+        return surface
+
     def draw_cell(self, row, col):
         """
         Draw a single cell on the screen.
@@ -36,50 +308,20 @@ class Renderer:
                 col (int) - Grid column (0-9)
         Outputs: None
         """
-        if not self.game.board:
+        # Hoist the game reference once; the repeated self.game.* chains
+        # were two attribute lookups per use.
+        game = self.game
+        if not game.board:
             return
-            
-        cell = self.game.board.get_cell(row, col)
+
+        cell = game.board.get_cell(row, col)
         if not cell:
             return
-        
-        # Calculate screen position
-        x = col * self.game.CELL_SIZE
-        y = row * self.game.CELL_SIZE + self.game.INFO_HEIGHT
-        rect = pygame.Rect(x, y, self.game.CELL_SIZE, self.game.CELL_SIZE)
-        
-        # Choose cell color based on state
-        if cell.is_revealed:
-            if cell.is_mine:
-                color = self.game.COLORS['cell_mine']
-            else:
-                color = self.game.COLORS['cell_revealed']
-        else:
-            color = self.game.COLORS['cell_covered']
-        
-        # Draw cell background
-        pygame.draw.rect(self.game.screen, color, rect)
-        pygame.draw.rect(self.game.screen, self.game.COLORS['border'], rect, 1)
-        
-        # Draw cell content
-        if cell.is_flagged and not cell.is_revealed:
-            # Draw flag
-            flag_text = self.game.font.render('F', True, self.game.COLORS['text'])
-            text_rect = flag_text.get_rect(center=rect.center)
-            self.game.screen.blit(flag_text, text_rect)
-        elif cell.is_revealed:
-            if cell.is_mine:
-                # Draw mine
-                mine_text = self.game.font.render('*', True, self.game.COLORS['text'])
-                text_rect = mine_text.get_rect(center=rect.center)
-                self.game.screen.blit(mine_text, text_rect)
-            elif cell.adjacent_mines > 0:
-                # Draw number with appropriate color
-                number_color = self.game.COLORS['number_colors'].get(
-                    cell.adjacent_mines, self.game.COLORS['text'])
-                number_text = self.game.font.render(str(cell.adjacent_mines), True, number_color)
-                text_rect = number_text.get_rect(center=rect.center)
-                self.game.screen.blit(number_text, text_rect)
+
+        # One blit of the pre-composited tile (background, border, and
+        # glyph already combined in the atlas)
+        game.screen.blit(self._cell_tile(cell),
+                         self._cell_xy[row * game.GRID_WIDTH + col])
     
     def draw_info_panel(self):
         """
@@ -90,52 +332,39 @@ class Renderer:
         Creation Date: September 16, 2025
         External Sources: N/A - Original Code
         """
-        if not self.game.game_state:
+        game = self.game
+        state = game.game_state
+        if not state:
             return
-            
-        info_rect = pygame.Rect(0, 0, self.game.WINDOW_WIDTH, self.game.INFO_HEIGHT)
-        pygame.draw.rect(self.game.screen, self.game.COLORS['background'], info_rect)
-        
-        # Game status
-        status_text = self.game.font.render(f"Status: {self.game.game_state.get_status_text()}", True, self.game.COLORS['text'])
-        self.game.screen.blit(status_text, (10, 10))
-        
-        # Remaining mines
-        mines_remaining = self.game.game_state.get_remaining_mines()
-        mines_text = self.game.font.render(f"Mines: {mines_remaining}", 
-                                        True, self.game.COLORS['text'])
-        self.game.screen.blit(mines_text, (10, 35))
-        
+
+        screen = game.screen
+        text_color = game.COLORS['text']
+
+        # Blit the pre-composed static panel (fill + column labels), then
+        # overlay only the dynamic text.
+        screen.blit(self._info_bg, (0, 0))
+
+        # Game status; the formatted string repeats for seconds at a time
+        # and only a handful of variants exist, so the cache serves nearly
+        # every frame without touching the font renderer.
+        status_text = self._text(game.font,
+                                 f"Status: {state.get_status_text()}",
+                                 text_color)
+        screen.blit(status_text, (10, 10))
+
+        # Remaining mines; bounded to the 10-20 mine range minus flags
+        mines_text = self._text(game.font,
+                                f"Mines: {state.get_remaining_mines()}",
+                                text_color)
+        screen.blit(mines_text, (10, 35))
+
         # Instructions
-        if not self.game.game_state.first_click_made:
-            instruction_text = self.game.small_font.render("Left click: Reveal | Right click: Flag", 
-                                                        True, self.game.COLORS['text'])
-            self.game.screen.blit(instruction_text, (150, 10))
-        
-        # Column labels (A-J)
-        for col in range(self.game.GRID_WIDTH):
-            label = chr(ord('A') + col)
-            label_text = self.game.small_font.render(label, True, self.game.COLORS['text'])
-            x = col * self.game.CELL_SIZE + self.game.CELL_SIZE // 2 - label_text.get_width() // 2
-            self.game.screen.blit(label_text, (x, self.game.INFO_HEIGHT - 20))
-    
-    def draw_row_labels(self):
-        """
-        Description: Draw row labels (1-10) on the left side of the grid.
-        Args: None
-        Returns: None
-        Author: John Tran
-        Creation Date: September 16, 2025
-        External Sources: N/A - Original Code
-        """
-        for row in range(self.game.GRID_HEIGHT):
-            label = str(row + 1)
-            label_text = self.game.small_font.render(label, True, self.game.COLORS['text'])
-            y = row * self.game.CELL_SIZE + self.game.INFO_HEIGHT + self.game.CELL_SIZE // 2 - label_text.get_height() // 2
-            # Draw label to the left of the grid (requires expanding window width slightly)
-            # For now, we'll skip row labels to maintain the specified window size
-            pass
-    
+        if not state.first_click_made:
+            instruction_text = self._text(game.small_font,
+                                          "Left click: Reveal | Right click: Flag",
+                                          text_color)
+            screen.blit(instruction_text, (150, 10))
+
     def draw_end_screen(self):
         """
         Description: Draw the end screen UI (win/loss).
@@ -148,11 +377,16 @@ class Renderer:
         if not self.game.game_state:
             return
             
-        # Semi-transparent overlay
-        overlay = pygame.Surface((self.game.WINDOW_WIDTH, self.game.WINDOW_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.game.screen.blit(overlay, (0, 0))
+        # Semi-transparent overlay, allocated and filled once instead of on
+        # every frame the end screen is visible; convert() stores it in the
+        # display's pixel format so the repeated blit stays cheap.
+        if self._end_overlay is None:
+            overlay = pygame.Surface((self.game.WINDOW_WIDTH,
+                                      self.game.WINDOW_HEIGHT)).convert()
+            overlay.set_alpha(200)
+            overlay.fill((0, 0, 0))
+            self._end_overlay = overlay
+        self.game.screen.blit(self._end_overlay, (0, 0))
         
         # Get game status
         status = self.game.game_state.get_status_text()
@@ -160,33 +394,20 @@ class Renderer:
         
         # Main message
         title_color = (0, 255, 0) if is_win else (255, 0, 0)
-        title_text = pygame.font.Font(None, 48).render(status, True, title_color)
+        title_text = self._text(self._status_font, status, title_color)
         title_rect = title_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 150))
         self.game.screen.blit(title_text, title_rect)
         
         # Mine count adjustment
-        mine_text = self.game.font.render(f"Current mines: {self.game.mine_count}", True, (255, 255, 255))
+        mine_text = self._text(self.game.font,
+                               f"Current mines: {self.game.mine_count}",
+                               (255, 255, 255))
         mine_rect = mine_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 200))
         self.game.screen.blit(mine_text, mine_rect)
         
-        # Instructions - different for win vs loss
-        if is_win:
-            instructions = [
-                "Press SPACE to play again",
-                "Press UP/DOWN arrows to adjust mines (10-20)",
-                "Press ESC to quit"
-            ]
-        else:
-            instructions = [
-                "Press SPACE to continue to setup",
-                "Press R to retry with same settings",
-                "Press ESC to quit"
-            ]
-        
-        for i, instruction in enumerate(instructions):
-            inst_text = self.game.small_font.render(instruction, True, (255, 255, 255))
-            inst_rect = inst_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 250 + i * 25))
-            self.game.screen.blit(inst_text, inst_rect)
+        # Instructions - pre-rendered and pre-positioned per outcome,
+        # drawn with one batched call
+        self.game.screen.blits(self._end_instructions[is_win])
     
     def draw_start_screen(self):
         """
@@ -197,52 +418,83 @@ class Renderer:
         Creation Date: September 16, 2025
         External Sources: N/A - Original Code
         """
-        # Clear background
-        self.game.screen.fill((64, 64, 64))  # Dark gray background
-        
-        # Title
-        title_text = pygame.font.Font(None, 64).render("MINESWEEPER", True, (255, 255, 255))
-        title_rect = title_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 80))
-        self.game.screen.blit(title_text, title_rect)
-        
-        # Subtitle
-        subtitle_text = self.game.font.render("EECS 581 Project 1", True, (200, 200, 200))
-        subtitle_rect = subtitle_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 120))
-        self.game.screen.blit(subtitle_text, subtitle_rect)
-        
-        # Mine count selection
-        mine_text = pygame.font.Font(None, 36).render(f"Mines: {self.game.mine_count}", True, (255, 255, 0))
+        # Blit the pre-rendered screen, then overlay the one dynamic
+        # element: the current mine count selection.
+        self.game.screen.blit(self._start_bg, (0, 0))
+
+        mine_text = self._text(self._mine_font, f"Mines: {self.game.mine_count}",
+                               (255, 255, 0))
         mine_rect = mine_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 180))
         self.game.screen.blit(mine_text, mine_rect)
-        
-        # Instructions
-        instructions = [
-            "HOW TO PLAY:",
-            "• Left click to reveal cells",
-            "• Right click to flag suspected mines",
-            "• Avoid clicking on mines!",
-            "• Flag all mines to win",
-            "",
-            "CONTROLS:",
-            "• UP/DOWN arrows: Adjust mine count",
-            "• SPACE: Start game",
-            "• ESC: Quit"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            if instruction == "HOW TO PLAY:" or instruction == "CONTROLS:":
-                color = (255, 255, 0)  # Yellow for headers
-                font = self.game.font
-            elif instruction == "":
-                continue  # Skip empty lines
-            else:
-                color = (255, 255, 255)  # White for regular text
-                font = self.game.small_font
-            
-            inst_text = font.render(instruction, True, color)
-            inst_rect = inst_text.get_rect(center=(self.game.WINDOW_WIDTH // 2, 220 + i * 20))
-            self.game.screen.blit(inst_text, inst_rect)
-    
+
+    def _cell_state_byte(self, cell):
+        """
+        Description: Encode a cell's drawable state in one byte for change detection.
+        Args:
+            cell (Cell): Cell to encode
+        Returns: int - Packed state byte (revealed/flagged/mine bits plus adjacent count)
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        return ((cell.is_revealed << 6) | (cell.is_flagged << 5) |
+                (cell.is_mine << 4) | cell.adjacent_mines)
+
+    def _draw_all_cells(self):
+        """
+        Description: Draw every cell with one batched blits call of pre-composited tiles and record their states.
+        Args: None
+        Returns: None
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        # Surface.fblits would shave a little more but is pygame-ce only;
+        # blits is the portable batched call.
+        board = self.game.board
+        if not board:
+            return
+
+        # Tile selection over the flat cell view in a single
+        # comprehension; the blit loop itself then runs in C.
+        cell_tile = self._cell_tile
+        self.game.screen.blits(
+            [(cell_tile(cell), xy)
+             for cell, xy in zip(board.cells, self._cell_xy)])
+        # Record the drawn states for the dirty-cell scan in one pass
+        self._prev_cell_state[:] = bytes(map(self._cell_state_byte,
+                                             board.cells))
+
+    def _draw_dirty_cells(self):
+        """
+        Description: Redraw only the cells whose drawable state changed since the last recorded frame.
+        Args: None
+        Returns: list - Screen rects of the cells that were redrawn
+        Author: John Tran
+        Creation Date: September 16, 2025
+        External Sources: N/A - Original Code
+        """
+        board = self.game.board
+        if not board:
+            return []
+
+        grid_width = self.game.GRID_WIDTH
+        state_byte = self._cell_state_byte
+        prev_state = self._prev_cell_state
+        cell_rects = self._cell_rects
+        draw_cell = self.draw_cell
+        dirty_rects = []
+        for row in range(self.game.GRID_HEIGHT):
+            grid_row = board.grid[row]
+            base = row * grid_width
+            for col in range(grid_width):
+                state = state_byte(grid_row[col])
+                if state != prev_state[base + col]:
+                    prev_state[base + col] = state
+                    draw_cell(row, col)
+                    dirty_rects.append(cell_rects[base + col])
+        return dirty_rects
+
     def draw_game(self):
         """
         Description: Draw the complete game interface.
@@ -252,21 +504,68 @@ class Renderer:
         Creation Date: September 16, 2025
         External Sources: N/A - Original Code
         """
-        if self.game.show_start_screen:
+        game = self.game
+        if game.show_start_screen:
+            # The start screen paints over the board view; force a full
+            # board repaint when gameplay resumes. Only the mine count can
+            # change while it is up, so identical frames are skipped.
+            self._board_stale = True
+            self._end_base = None
+            sig = ('start', game.mine_count)
+            if sig == self._frame_sig:
+                return
             self.draw_start_screen()
+        elif game.show_end_screen:
+            # End screen composites over the board, so repaint fully while
+            # it is up and when returning from it.
+            self._board_stale = True
+            sig = ('end',
+                   game.game_state.get_status_text() if game.game_state else None,
+                   game.mine_count)
+            if sig == self._frame_sig:
+                return
+            if self._end_base is None:
+                # First end-screen frame: draw the final board and panel
+                # once (no background fill needed - together they cover
+                # every pixel) and snapshot the result.
+                self.draw_info_panel()
+                self._draw_all_cells()
+                self._end_base = game.screen.copy()
+            else:
+                # Later end-screen frames (mine-count changes after a
+                # win) restore the snapshot instead of redrawing the
+                # board and panel.
+                game.screen.blit(self._end_base, (0, 0))
+            self.draw_end_screen()
         else:
-            self.game.screen.fill(self.game.COLORS['background'])
-            
-            # Draw information panel
-            self.draw_info_panel()
-            
-            # Draw all cells
-            for row in range(self.game.GRID_HEIGHT):
-                for col in range(self.game.GRID_WIDTH):
-                    self.draw_cell(row, col)
-            
-            # Draw end screen overlay if game is over
-            if self.game.show_end_screen:
-                self.draw_end_screen()
-        
+            state = game.game_state
+            sig = ('play',
+                   state.get_status_text() if state else None,
+                   state.get_remaining_mines() if state else None,
+                   state.first_click_made if state else None)
+            if self._board_stale:
+                # Full repaint after a screen transition or new game;
+                # everything changed, so present with a plain flip. The
+                # panel and cell tiles tile the window exactly, so no
+                # background fill pass is needed first.
+                self._end_base = None
+                self._draw_all_cells()
+                self._board_stale = False
+                self.draw_info_panel()
+                self._frame_sig = sig
+                pygame.display.flip()
+                return
+            # Steady state: redraw only what changed and present just
+            # those rects; update() with a short rect list beats flip()
+            # when most of the window is untouched.
+            dirty_rects = self._draw_dirty_cells()
+            if sig != self._frame_sig:
+                self.draw_info_panel()
+                dirty_rects.append(self._info_rect)
+                self._frame_sig = sig
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            return
+
+        self._frame_sig = sig
         pygame.display.flip()
\ No newline at end of file
@@ -7,12 +7,17 @@ Creation Date: September 17, 2025
 External Sources: N/A - Original Code
 """
 
+import os
+
+# Silence the pygame support banner before the import triggers it.
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
 import pygame
 import sys
 from core.board import Board
 from core.gamestate import GameState
-from input_output.input_controller import InputController
-from input_output.renderer import Renderer
+from input_output.input_controller import InputController, HANDLED_EVENT_TYPES
+from input_output.renderer import Renderer, get_font
 
 class MinesweeperGame:
     """
@@ -31,9 +36,18 @@ class MinesweeperGame:
         Creation Date: September 17, 2025
         External Sources: N/A - Original Code
         """
-        # Initialize Pygame and set up game constants.
-        
-        pygame.init()
+        # Initialize only the Pygame subsystems this game uses; the
+        # blanket pygame.init() also probes mixer, joystick, and friends,
+        # which enumerate hardware and slow time-to-first-frame for
+        # subsystems that are never touched.
+        pygame.display.init()
+        pygame.font.init()
+
+        # Only queue the event types the InputController actually handles;
+        # everything else (mouse motion, window focus, ...) is dropped at
+        # the SDL layer before a Python Event object is ever built.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(HANDLED_EVENT_TYPES))
 
         # Set up game constants for grid and UI layout.
         self.CELL_SIZE = 40
@@ -69,13 +83,17 @@ class MinesweeperGame:
                 8: (128, 128, 128)
             }
         }
+        # Flat tuple view of the number colors, indexed by count - 1;
+        # sequence indexing beats the two nested dict lookups.
+        self.NUMBER_COLORS = tuple(self.COLORS['number_colors'][n]
+                                   for n in range(1, 9))
         
         # Initialize Pygame components
         self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
         pygame.display.set_caption("Minesweeper - EECS 581 Project 1")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = get_font(24)
+        self.small_font = get_font(20)
         
         # Initialize game components
         self.mine_count = 10  # Default mine count
@@ -96,13 +114,36 @@ class MinesweeperGame:
         Creation Date: September 17, 2025
         External Sources: N/A - Original Code
         """
-        # Reset board and game state for a new session.
-        
-        self.board = Board(self.mine_count)
-        self.game_state = GameState(self.mine_count)
+        # Reuse the existing board and game state when possible - resetting
+        # in place avoids reallocating the cell grid every game.
+        if self.board is None:
+            self.board = Board(self.mine_count)
+        else:
+            self.board.reset(self.mine_count)
+        if self.game_state is None:
+            self.game_state = GameState(self.mine_count)
+        else:
+            self.game_state.reset(self.mine_count)
         self.show_end_screen = False
         self.show_start_screen = False
     
+    def _finalize_game(self, won):
+        """
+        Description: Apply the full end-of-game transition (mine reveal on loss, state update, end screen) in one place.
+        Args:
+            won (bool): True if player won, False if lost
+        Returns: None
+        Author: Changwen Gong
+        Creation Date: September 17, 2025
+        External Sources: N/A - Original Code
+        """
+        # Single batch for the end-game side effects so every caller takes
+        # the same transition.
+        if not won:
+            self.board.reveal_all_mines()
+        self.game_state.end_game(won=won)
+        self.show_end_screen = True
+
     def _update_game_statistics(self):
         """
         Description: Update game state with current board statistics (revealed cells, flags placed).
@@ -139,28 +180,37 @@ class MinesweeperGame:
         Creation Date: September 17, 2025
         External Sources: N/A - Original Code
         """
-        # Print game instructions to console for user reference.
+        # Print game instructions to console for user reference; one
+        # write instead of nine print calls, each of which would acquire
+        # the stdout lock and flush separately.
         running = True
-        print("Minesweeper Game Started!")
-        print("Controls:")
-        print("- Left click: Reveal cell")
-        print("- Right click: Toggle flag")
-        print("- SPACE: Start new game")
-        print("- R key: Reset game (during play)")
-        print("- UP/DOWN arrows: Adjust mine count (10-20)")
-        print("- +/- keys: Also adjust mine count")
-        print("- ESC: Quit game")
-
-        # Main event loop for game execution.
+        sys.stdout.write("\n".join([
+            "Minesweeper Game Started!",
+            "Controls:",
+            "- Left click: Reveal cell",
+            "- Right click: Toggle flag",
+            "- SPACE: Start new game",
+            "- R key: Reset game (during play)",
+            "- UP/DOWN arrows: Adjust mine count (10-20)",
+            "- +/- keys: Also adjust mine count",
+            "- ESC: Quit game",
+        ]) + "\n")
+
+        # Main event loop for game execution. The per-frame calls are
+        # bound to locals once - each self.x.y chain would otherwise cost
+        # two attribute lookups every frame.
+        handle_events = self.input_controller.handle_events
+        draw_game = self.renderer.draw_game
+        tick = self.clock.tick
         while running:
             # Handle events from user input and system.
-            running = self._handle_events()
+            running = handle_events()
 
             # Draw game using renderer to update UI.
-            self.renderer.draw_game()
+            draw_game()
 
             # Control frame rate for smooth gameplay.
-            self.clock.tick(60)
+            tick(60)
 
         # Clean up and exit Pygame when game ends.
         